@@ -1,7 +1,23 @@
 import os
 import re
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
 import requests
-from bs4 import BeautifulSoup
+
+from jsoncache import cache_path, load_json, save_json
+
+# Number of yt-dlp downloaders to run concurrently
+DEFAULT_WORKERS = 8
+
+# Latest-episode lookup is cached on disk to avoid refetching the show page
+CACHE_PATH = cache_path("latest_sn.json")
+CACHE_TTL_SECS = 4 * 3600
+
+# Episode links on the show page; matched against the raw response bytes
+_EP_RE = re.compile(rb"/shows/security-now/episodes/(\d+)")
 
 
 def get_latest_security_now_episode() -> int:
@@ -9,59 +25,108 @@ def get_latest_security_now_episode() -> int:
 
     Strategy:
     - Load the page (which redirects to /shows/security-now).
-    - Extract all links that match /shows/security-now/episodes/<number>.
+    - Scan the raw HTML for all links that match /shows/security-now/episodes/<number>.
     - Return the maximum episode number found.
+    The result is cached for CACHE_TTL_SECS; after that the page is revalidated
+    with ETag/Last-Modified so an unchanged page costs only a 304 round-trip.
     If anything fails, fall back to a safe default so the script still works.
     """
     url = "https://twit.tv/sn"
+    cache = load_json(CACHE_PATH)
+    cached_ep = cache.get("ep")
+    if isinstance(cached_ep, int) and time.time() - cache.get("ts", 0) < CACHE_TTL_SECS:
+        return cached_ep
     try:
         headers = {
             "User-Agent": "clubtwitshows/0.1 (+https://twit.tv/)"
         }
+        if isinstance(cached_ep, int):
+            if cache.get("etag"):
+                headers["If-None-Match"] = cache["etag"]
+            if cache.get("last_modified"):
+                headers["If-Modified-Since"] = cache["last_modified"]
         resp = requests.get(url, headers=headers, timeout=20)
+        if resp.status_code == 304 and isinstance(cached_ep, int):
+            cache["ts"] = time.time()
+            save_json(CACHE_PATH, cache)
+            return cached_ep
         resp.raise_for_status()
-        html = resp.text
-
-        # First, try BeautifulSoup to find anchors
-        soup = BeautifulSoup(html, "lxml")
-        candidates = set()
-        for a in soup.find_all("a", href=True):
-            m = re.search(r"/shows/security-now/episodes/(\d+)", a["href"])  # noqa: W605
-            if m:
-                candidates.add(int(m.group(1)))
-
-        # Fallback: regex over the whole page
-        if not candidates:
-            for m in re.finditer(r"/shows/security-now/episodes/(\d+)", html):  # noqa: W605
-                candidates.add(int(m.group(1)))
-
+        # A single regex scan over the raw page is enough to find episode links
+        candidates = {int(m.group(1)) for m in _EP_RE.finditer(resp.content)}
         if candidates:
-            return max(candidates)
+            latest = max(candidates)
+            save_json(CACHE_PATH, {
+                "ep": latest,
+                "ts": time.time(),
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+            })
+            return latest
     except Exception:
         # Swallow and use fallback below
         pass
 
+    # Prefer a stale cached value over the hard-coded fallback
+    if isinstance(cached_ep, int):
+        return cached_ep
     # Fallback to a conservative recent value if scraping fails
     return 1052
 
 
+def download_episodes(episodes: List[int], speed: float = 0) -> int:
+    """Download Security Now episodes in-process with one yt-dlp instance.
+
+    The shared archive.txt lets yt-dlp skip episodes that were already fetched.
+    Failed episodes are reported and skipped. speed caps this call's rate in
+    Kbps (0 = no limit). Without the yt_dlp package, the yt-dlp command is run
+    instead. Returns the yt-dlp return code.
+    """
+    urls = [f"https://twit.tv/shows/security-now/episodes/{episode}" for episode in episodes]
+    try:
+        from yt_dlp import YoutubeDL
+    except ImportError:
+        return _run_yt_dlp_cli(urls, speed)
+    opts = {
+        "download_archive": "archive.txt",
+        "ratelimit": int(speed * 1024) if speed > 0 else None,
+        "ignoreerrors": True,
+        # Keep the per-episode lines but drop progress bars, which several
+        # parallel downloaders would interleave into noise
+        "noprogress": True,
+    }
+    with YoutubeDL(opts) as ydl:
+        return ydl.download(urls)
+
+
+def _run_yt_dlp_cli(urls: List[str], speed: float) -> int:
+    """Downloads urls with the yt-dlp command using the same options as download_episodes."""
+    cmd = ["yt-dlp", "--download-archive", "archive.txt", "--ignore-errors", "--no-progress"]
+    if speed > 0:
+        cmd += ["--limit-rate", str(int(speed * 1024))]
+    try:
+        return subprocess.run(cmd + urls).returncode
+    except FileNotFoundError as e:
+        raise RuntimeError(
+            "Downloading needs yt-dlp; install it with 'pip install yt-dlp'"
+        ) from e
+
+
 if __name__ == "__main__":
     latest_episode = get_latest_security_now_episode()
-    speed = input("Speed in Kbps(blank = no limit): ")
-    speed = speed if speed else "0"
+    speed = input("Total speed in Kbps across all downloads (blank = no limit): ")
+    speed = int(speed) if speed else 0
+    workers = input(f"Parallel downloads (blank = {DEFAULT_WORKERS}): ")
+    workers = max(1, int(workers)) if workers else DEFAULT_WORKERS
 
     # Change to your desired download directory
     os.chdir('/media/mainmeister/2TBB/security_now')
 
-    for episode in range(1, latest_episode + 1):
-        if int(speed) > 0:
-            os.system(
-                f"yt-dlp --limit-rate {speed}K --download-archive archive.txt "
-                f"https://twit.tv/shows/security-now/episodes/{episode}"
-            )
-        else:
-            os.system(
-                f"yt-dlp --download-archive archive.txt "
-                f"https://twit.tv/shows/security-now/episodes/{episode}"
-            )
+    # yt-dlp is network bound, so run several downloaders at once; each worker
+    # gets an interleaved share of the episodes and its own YoutubeDL instance.
+    # The speed limit is split between the workers so the total stays as asked.
+    episodes = list(range(1, latest_episode + 1))
+    shards = [episodes[i::workers] for i in range(workers)]
+    worker_speed = speed / workers
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(lambda shard: download_episodes(shard, worker_speed), shards))
     print("All done!")
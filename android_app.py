@@ -1,12 +1,13 @@
+import math
 import os
+import re
 import sys
 import threading
-import time
 from typing import List, Dict, Any, Optional
-
-import requests
+from urllib.parse import urlparse
 
 from clubtwit import ClubTwit
+from downloads import SESSION, BatchDownloader, DownloaderThread, Progress, progress_stats
 
 # Kivy UI
 from kivy.app import App
@@ -14,15 +15,6 @@ from kivy.lang import Builder
 from kivy.properties import ListProperty, DictProperty, StringProperty, NumericProperty, BooleanProperty
 from kivy.uix.boxlayout import BoxLayout
 from kivy.clock import Clock
-from kivy.utils import platform
-
-# Optional Android-specific pieces (guarded imports)
-try:
-    if platform == 'android':
-        from android.permissions import request_permissions, Permission
-        from android.storage import primary_external_storage_path
-except Exception:
-    pass
 
 KV = """
 <RootView>:
@@ -49,6 +41,7 @@ KV = """
             text: 'Refresh'
             size_hint_x: None
             width: '100dp'
+            disabled: root.is_fetching
             on_release: root.fetch_shows()
 
     BoxLayout:
@@ -119,6 +112,21 @@ KV = """
                     disabled: not root.is_downloading
                     on_release: root.cancel_download()
 
+            BoxLayout:
+                size_hint_y: None
+                height: '36dp'
+                spacing: '8dp'
+                Button:
+                    id: batch_add_btn
+                    text: 'Add to Batch'
+                    disabled: not root.can_download
+                    on_release: root.add_to_batch()
+                Button:
+                    id: batch_dl_btn
+                    text: 'Download Batch ({})'.format(len(root.batch_indices))
+                    disabled: root.is_downloading or not root.batch_indices
+                    on_release: root.start_batch_download()
+
             BoxLayout:
                 size_hint_y: None
                 height: '28dp'
@@ -162,78 +170,49 @@ KV = """
 """
 
 
+def _get_platform() -> str:
+    """Returns Kivy's platform name; kivy.utils is only imported when asked."""
+    from kivy.utils import platform
+    return platform
+
+
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+_MAX_ETA_SECS = 99 * 3600 + 59 * 60 + 59
+# Anything other than letters, digits, '_', ' ' and '.' is dropped from file names
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w .]")
+# First four tokens of an RFC 822 pubDate, e.g. "Wed, 01 Jan 2025"
+_DATE_PREFIX = re.compile(r"^\s*(\S+\s+\S+\s+\S+\s+\S+)")
+
+
+def _short_date(date: str) -> str:
+    """Trims a pubDate to its day/date part for the show list."""
+    m = _DATE_PREFIX.match(date)
+    return m.group(1) if m else ' '.join(date.split())
+
+
 def _format_bytes(num_bytes: float) -> str:
-    units = ["B", "KB", "MB", "GB", "TB"]
     size = float(num_bytes)
-    for unit in units:
-        if size < 1024.0 or unit == units[-1]:
-            return f"{size:.2f} {unit}"
-        size /= 1024.0
-    return f"{size:.2f} TB"
+    if not math.isfinite(size):
+        return f"{size:.2f} TB"
+    # Pick the unit directly from the magnitude (each unit is 2**10 larger)
+    i = max(0, min(len(_UNITS) - 1, (int(size).bit_length() - 1) // 10))
+    return f"{size / (1 << (10 * i)):.2f} {_UNITS[i]}"
 
 
 def _format_time(seconds: float) -> str:
     try:
-        import math
         if not math.isfinite(seconds) or seconds < 0:
             return "--:--"
-        max_secs = 99 * 3600 + 59 * 60 + 59
-        secs_f = min(float(seconds), float(max_secs))
-        secs = int(secs_f + 0.5)
+        secs = int(min(float(seconds), float(_MAX_ETA_SECS)) + 0.5)
     except Exception:
         return "--:--"
-    h = secs // 3600
-    m = (secs % 3600) // 60
-    s = secs % 60
+    h, rem = divmod(secs, 3600)
+    m, s = divmod(rem, 60)
     return f"{h}:{m:02d}:{s:02d}" if h > 0 else f"{m}:{s:02d}"
 
 
-class DownloaderThread(threading.Thread):
-    def __init__(self, url: str, filepath: str, progress_cb, done_cb, error_cb, stop_flag):
-        super().__init__(daemon=True)
-        self.url = url
-        self.filepath = filepath
-        self.progress_cb = progress_cb
-        self.done_cb = done_cb
-        self.error_cb = error_cb
-        self.stop_flag = stop_flag
-
-    def run(self):
-        try:
-            start_time = time.time()
-            bytes_downloaded = 0
-            aborted = False
-            with requests.get(self.url, stream=True) as r:
-                r.raise_for_status()
-                total_size = int(r.headers.get('content-length', 0))
-                with open(self.filepath, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if self.stop_flag['stop']:
-                            aborted = True
-                            break
-                        if not chunk:
-                            continue
-                        f.write(chunk)
-                        bytes_downloaded += len(chunk)
-                        # Progress details
-                        percent = int((bytes_downloaded * 100) // total_size) if total_size > 0 else 0
-                        elapsed = max(time.time() - start_time, 1e-6)
-                        rate = bytes_downloaded / elapsed
-                        eta = ((total_size - bytes_downloaded) / rate) if (total_size > 0 and rate > 0) else -1.0
-                        # Send to UI thread
-                        Clock.schedule_once(lambda dt, p=percent, d=bytes_downloaded, t=total_size, r=rate, e=eta: self.progress_cb(p, d, t, r, e))
-
-            if aborted:
-                try:
-                    if os.path.exists(self.filepath):
-                        os.remove(self.filepath)
-                except Exception:
-                    pass
-                Clock.schedule_once(lambda dt: self.error_cb("Canceled"))
-            else:
-                Clock.schedule_once(lambda dt: self.done_cb())
-        except Exception as e:
-            Clock.schedule_once(lambda dt, msg=str(e): self.error_cb(msg))
+# Seconds between UI progress refreshes
+PROGRESS_INTERVAL = 0.1
 
 
 class RootView(BoxLayout):
@@ -251,17 +230,27 @@ class RootView(BoxLayout):
     save_dir = StringProperty('')
 
     is_downloading = BooleanProperty(False)
+    is_fetching = BooleanProperty(False)
     can_download = BooleanProperty(False)
 
+    batch_indices = ListProperty([])
+
+    _club_twit: Optional[ClubTwit] = None
     _download_thread: Optional[DownloaderThread] = None
+    _batch_thread: Optional[BatchDownloader] = None
     _stop_flag = DictProperty({'stop': False})
+    _progress: Optional[Progress] = None
+    _pump_event = None
 
     def on_kv_post(self, base_widget):
         # Initialize feed_url from env if present
         self.feed_url = os.getenv('twitcluburl', '').strip()
         # Default save location
-        if platform == 'android':
+        is_android = _get_platform() == 'android'
+        if is_android:
             try:
+                # Android-only modules are imported on demand
+                from android.storage import primary_external_storage_path
                 base = primary_external_storage_path()
             except Exception:
                 base = os.path.expanduser('~')
@@ -270,8 +259,9 @@ class RootView(BoxLayout):
         self.save_dir = os.path.join(base, 'Download')
 
         # Request permissions on Android
-        if platform == 'android':
+        if is_android:
             try:
+                from android.permissions import request_permissions, Permission
                 request_permissions([Permission.READ_EXTERNAL_STORAGE, Permission.WRITE_EXTERNAL_STORAGE])
             except Exception:
                 pass
@@ -291,9 +281,20 @@ class RootView(BoxLayout):
         self.fetch_shows()
 
     def fetch_shows(self):
+        # Network work runs on plain daemon threads with blocking requests;
+        # transfers already overlap (BatchDownloader, Range parts), so an
+        # asyncio/aiohttp loop would add a dependency without removing a wait.
+        if self.is_fetching:
+            # One fetch at a time: workers would race on _club_twit and its parser
+            return
+        self.is_fetching = True
+
         def work():
             try:
-                ct = ClubTwit()
+                # Reuse one ClubTwit so refreshes can send conditional GETs
+                if self._club_twit is None:
+                    self._club_twit = ClubTwit(session=SESSION)
+                ct = self._club_twit
                 # Override environment URL if user typed one
                 if self.feed_url:
                     ct.clubtwit_url = self.feed_url
@@ -305,23 +306,24 @@ class RootView(BoxLayout):
         self.status_line = 'Fetching shows...'
 
     def _populate_shows(self, shows: List[Dict[str, Any]]):
+        self.is_fetching = False
         self.shows = shows
-        data = []
-        for idx, s in enumerate(shows):
-            title = s.get('Title', 'No Title')
-            date = s.get('PubDate', '')
-            length_bytes = s.get('Length', 0) or 0
-            date_short = ' '.join(date.split()[:4]) if date else ''
-            data.append({
+        # Batch entries are indices into the previous list
+        self.batch_indices = []
+        # ClubTwit._parse_xml always sets Title, PubDate and Length
+        self.rv_data = [
+            {
                 'index': idx,
-                'title': title,
-                'date': date_short,
-                'length_bytes': length_bytes,
-            })
-        self.rv_data = data
+                'title': s['Title'],
+                'date': _short_date(s['PubDate']),
+                'length_bytes': s['Length'],
+            }
+            for idx, s in enumerate(shows)
+        ]
         self.status_line = f'Loaded {len(shows)} shows.'
 
     def _show_error(self, msg: str):
+        self.is_fetching = False
         self.status_line = f'Error: {msg}'
 
     def on_select_row(self, index: int):
@@ -343,6 +345,22 @@ class RootView(BoxLayout):
         except Exception as e:
             self.status_line = f'Folder error: {e}'
 
+    def _filepath_for(self, show: Dict[str, Any]) -> str:
+        """Build the local save path for a show from its title and link."""
+        url = show.get('Link') or ''
+        title = show.get('Title', 'download')
+        safe_name = _UNSAFE_FILENAME_CHARS.sub('', title).rstrip()
+        # Take the extension from the URL path so a query string cannot supply it
+        ext = os.path.splitext(urlparse(url).path)[1] or '.mp4'
+        filename = safe_name + ext
+
+        save_dir = self.save_dir or os.path.expanduser('~')
+        try:
+            os.makedirs(save_dir, exist_ok=True)
+        except Exception:
+            pass
+        return os.path.join(save_dir, filename)
+
     def start_download(self):
         if self.is_downloading:
             return
@@ -356,16 +374,7 @@ class RootView(BoxLayout):
         if not url:
             self.status_line = 'No download link for this item.'
             return
-        safe_name = ''.join(c for c in title if c.isalnum() or c in (' ', '.', '_')).rstrip()
-        ext = os.path.splitext(url)[1] or '.mp4'
-        filename = safe_name + ext
-
-        save_dir = self.save_dir or os.path.expanduser('~')
-        try:
-            os.makedirs(save_dir, exist_ok=True)
-        except Exception:
-            pass
-        filepath = os.path.join(save_dir, filename)
+        filepath = self._filepath_for(show)
 
         # Start threaded download
         self.is_downloading = True
@@ -377,20 +386,70 @@ class RootView(BoxLayout):
         self._download_thread = DownloaderThread(
             url=url,
             filepath=filepath,
-            progress_cb=self.on_progress,
+            progress=self._start_progress_pump(),
             done_cb=self.on_download_done,
             error_cb=self.on_download_error,
             stop_flag=self._stop_flag,
         )
         self._download_thread.start()
 
+    def add_to_batch(self):
+        idx = self.selected_index
+        if idx < 0 or idx >= len(self.shows) or not self.shows[idx].get('Link'):
+            self.status_line = 'Select a show first.'
+            return
+        if idx not in self.batch_indices:
+            self.batch_indices.append(idx)
+        self.status_line = f'{len(self.batch_indices)} shows in batch.'
+
+    def start_batch_download(self):
+        if self.is_downloading or not self.batch_indices:
+            return
+        jobs = [(self.shows[i]['Link'], self._filepath_for(self.shows[i])) for i in self.batch_indices]
+
+        # Start threaded batch download
+        self.is_downloading = True
+        self.can_download = False
+        self.progress_percent = 0
+        self.status_line = f'Downloading {len(jobs)} shows...'
+        self._stop_flag['stop'] = False
+
+        self._batch_thread = BatchDownloader(
+            jobs=jobs,
+            progress=self._start_progress_pump(),
+            done_cb=self.on_batch_done,
+            error_cb=self.on_download_error,
+            stop_flag=self._stop_flag,
+        )
+        self._batch_thread.start()
+
     def cancel_download(self):
         if not self.is_downloading:
             return
         self._stop_flag['stop'] = True
         self.status_line = 'Canceling download...'
 
-    # UI thread callbacks from DownloaderThread
+    def _start_progress_pump(self) -> Progress:
+        """Creates a fresh progress record and starts polling it on the UI thread."""
+        self._stop_progress_pump()
+        self._progress = Progress()
+        self._pump_event = Clock.schedule_interval(self._pump_progress, PROGRESS_INTERVAL)
+        return self._progress
+
+    def _stop_progress_pump(self):
+        if self._pump_event is not None:
+            self._pump_event.cancel()
+            self._pump_event = None
+
+    def _pump_progress(self, dt):
+        prog = self._progress
+        if prog is None or not prog.downloaded:
+            return
+        downloaded, total = prog.downloaded, prog.total
+        percent, rate, eta = progress_stats(downloaded, total, prog.start_time)
+        self.on_progress(percent, downloaded, total, rate, eta)
+
+    # UI thread callbacks from DownloaderThread / BatchDownloader
     def on_progress(self, percent: int, downloaded: int, total: int, rate_bps: float, eta_secs: float):
         if total > 0:
             self.progress_percent = percent
@@ -403,12 +462,18 @@ class RootView(BoxLayout):
             self.status_line = f"{rate_str}"
 
     def on_download_done(self):
+        self._stop_progress_pump()
         self.is_downloading = False
         self.can_download = self.selected_index >= 0 and bool(self.shows[self.selected_index].get('Link'))
         self.progress_percent = 100
         self.status_line = 'Download complete.'
 
+    def on_batch_done(self):
+        self.batch_indices = []
+        self.on_download_done()
+
     def on_download_error(self, msg: str):
+        self._stop_progress_pump()
         self.is_downloading = False
         self.can_download = self.selected_index >= 0 and bool(self.shows[self.selected_index].get('Link'))
         self.status_line = f'Download failed: {msg}'
@@ -1,9 +1,64 @@
+import html
 import os
+import re
+import xml.etree.ElementTree as ET
 import requests
 from dotenv import load_dotenv
-from lxml import etree
-from io import StringIO
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from io import BytesIO, StringIO
+from typing import List, Dict, Any, Optional, BinaryIO, Union
+
+# Fast path for item descriptions: first <p>...</p> with tags stripped. An
+# unclosed paragraph ends where the next <p> starts, as in an HTML parser.
+_FIRST_P_RE = re.compile(r"<p(?:\s[^>]*)?>(.*?)(?:</p>|<p[\s>])", re.I | re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _first_paragraph_text(description_html: str) -> str:
+    """
+    Returns the text of the first <p> in an item description, or "" if none.
+
+    Tag stripping and entity decoding are skipped when the paragraph holds
+    no markup or entities, which is the common case for feed descriptions.
+    """
+    m = _FIRST_P_RE.search(description_html)
+    if not m:
+        return ""
+    text = m.group(1)
+    if "<" in text:
+        text = _TAG_RE.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return text.strip()
+
+
+@lru_cache(maxsize=None)
+def _lxml_html_tools():
+    """Imports lxml on first use and builds the shared HTML parser and XPath objects."""
+    from lxml import etree
+    return etree, etree.HTMLParser(recover=True), etree.XPath("string(//p[1])"), etree.XPath("//body")
+
+
+def _parse_description_html(description_html: str) -> str:
+    """
+    Extracts readable text from an item description with a full HTML parse.
+
+    This is the slow path, used only when the first-paragraph regex finds
+    nothing. Returns the first paragraph's text, or all body text if there
+    is no non-empty paragraph.
+    """
+    etree, parser, first_p_xpath, body_xpath = _lxml_html_tools()
+    tree = etree.parse(StringIO(description_html), parser)
+    # All text within the first paragraph, including nested tags
+    description_text = str(first_p_xpath(tree)).strip()
+    # Fallback: if no <p> or empty, join all text content from body
+    if not description_text:
+        body = body_xpath(tree)
+        if body:
+            description_text = " ".join(t.strip() for t in body[0].itertext() if t.strip())
+        else:
+            description_text = " ".join(t.strip() for t in tree.getroot().itertext() if t.strip())
+    return description_text
 
 
 class ClubTwit:
@@ -14,22 +69,60 @@ class ClubTwit:
     and extracts a list of shows with their details.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
         """
         Initializes the ClubTwit class.
 
         Loads environment variables and gets the Club TWiT URL.
+
+        Args:
+            session: Optional shared requests.Session, so the feed fetch can
+                reuse the caller's pooled connections.
         """
         load_dotenv()
+        self.session: requests.Session = session or requests.Session()
         self.clubtwit_url: Optional[str] = os.getenv("twitcluburl")
         self.shows: List[Dict[str, Any]] = []
+        # Validators from the last successful fetch, used for conditional GETs
+        self._etag: Optional[str] = None
+        self._last_modified: Optional[str] = None
+        self._validated_url: Optional[str] = None
+
+    def cache_state(self) -> Dict[str, Any]:
+        """
+        Returns the validators from the last successful fetch.
+
+        The result can be persisted and handed to restore_cache_state() in a
+        later run, so the first fetch of that run can already be conditional.
+        """
+        return {
+            "url": self._validated_url,
+            "etag": self._etag,
+            "last_modified": self._last_modified,
+        }
+
+    def restore_cache_state(self, state: Dict[str, Any], shows: List[Dict[str, Any]]) -> None:
+        """
+        Seeds the fetch validators and show list from a previous run.
+
+        Args:
+            state: A dictionary as returned by cache_state().
+            shows: The show list that was parsed when state was recorded; it
+                is returned as-is if the server answers 304 Not Modified.
+        """
+        self._validated_url = state.get("url")
+        self._etag = state.get("etag")
+        self._last_modified = state.get("last_modified")
+        self.shows = shows
 
     def fetch_shows(self) -> List[Dict[str, Any]]:
         """
         Fetches the shows from the Club TWiT RSS feed.
 
-        Performs an HTTP GET request to the feed URL, parses the XML
-        response, and populates the list of shows.
+        Performs a streaming HTTP GET request to the feed URL, parses the
+        XML response as it arrives, and populates the list of shows.
+        Repeat calls send the previous ETag/Last-Modified; if the server
+        answers 304 Not Modified, the already parsed list is returned.
 
         Returns:
             A list of dictionaries, where each dictionary represents a show.
@@ -41,47 +134,68 @@ class ClubTwit:
         if not self.clubtwit_url:
             raise ValueError("The 'twitcluburl' environment variable is not set.")
 
-        response = requests.get(self.clubtwit_url)
-        response.raise_for_status()  # Raise an exception for bad status codes
-
-        self.shows = self._parse_xml(response.text)
+        headers: Dict[str, str] = {}
+        if self._validated_url == self.clubtwit_url:
+            if self._etag:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified:
+                headers["If-Modified-Since"] = self._last_modified
+
+        with self.session.get(self.clubtwit_url, headers=headers, stream=True) as response:
+            if response.status_code == 304 and headers:
+                return self.shows
+            response.raise_for_status()  # Raise an exception for bad status codes
+            # Let urllib3 undo any gzip/deflate transfer encoding for the parser
+            response.raw.decode_content = True
+            self.shows = self._parse_xml(response.raw)
+            self._etag = response.headers.get("ETag")
+            self._last_modified = response.headers.get("Last-Modified")
+            self._validated_url = self.clubtwit_url
         return self.shows
 
-    def _parse_xml(self, xml_string: str) -> List[Dict[str, Any]]:
+    def _parse_xml(self, xml_source: Union[bytes, BinaryIO]) -> List[Dict[str, Any]]:
         """
-        Parses the XML string of the RSS feed.
+        Parses the RSS feed incrementally, one <item> at a time.
+
+        Each item is cleared once processed so memory stays bounded by a
+        single item instead of the whole feed.
+
+        The XML is always handled as bytes, so the feed is never decoded
+        to str and re-encoded before parsing.
 
         Args:
-            xml_string: The XML content of the RSS feed as a string.
+            xml_source: The raw RSS feed XML, either as bytes or as a binary
+                file-like object such as a streamed response body.
 
         Returns:
-            A list of dictionaries representing the shows.
+            A list of dictionaries representing the shows. Every dictionary
+            has the keys Title, Description, Link, PubDate and Length.
         """
+        if isinstance(xml_source, (bytes, bytearray)):
+            xml_source = BytesIO(xml_source)
         shows_list: List[Dict[str, Any]] = []
-        root = etree.fromstring(bytes(xml_string, "utf-8"))
-        items = root.findall(".//item")
+        # Open elements, so each processed item can be detached from its parent
+        open_elements: List[ET.Element] = []
+
+        for event, item in ET.iterparse(xml_source, events=("start", "end")):
+            if event == "start":
+                open_elements.append(item)
+                continue
+            open_elements.pop()
+            if item.tag != "item":
+                continue
 
-        for item in items:
             title = item.findtext("title", "No Title")
             description_html = item.findtext("description", "")
 
-            # Parse the HTML description to get the first paragraph
+            # Extract the first paragraph of the HTML description
             description_text = ""
             if description_html:
+                description_text = _first_paragraph_text(description_html)
+            # Fall back to a full HTML parse when the regex finds nothing usable
+            if description_html and not description_text:
                 try:
-                    parser = etree.HTMLParser()
-                    tree = etree.parse(StringIO(description_html), parser)
-                    first_p = tree.xpath("//p[1]")
-                    if first_p:
-                        # Join all text within the first paragraph, including nested tags
-                        description_text = "".join(first_p[0].itertext()).strip()
-                    # Fallback: if no <p> or empty, join all text content from body
-                    if not description_text:
-                        body = tree.xpath('//body')
-                        if body:
-                            description_text = " ".join(t.strip() for t in body[0].itertext() if t.strip())
-                        else:
-                            description_text = " ".join(t.strip() for t in tree.getroot().itertext() if t.strip())
+                    description_text = _parse_description_html(description_html)
                 except Exception:
                     # Fallback if HTML parsing fails
                     description_text = "Could not parse description."
@@ -107,5 +221,10 @@ class ClubTwit:
             }
             shows_list.append(show_details)
 
+            # Release the processed item
+            item.clear()
+            if open_elements:
+                open_elements[-1].remove(item)
+
         return shows_list
 
@@ -0,0 +1,324 @@
+"""
+Download helpers shared by the Kivy apps (android_app.py and ios.py).
+
+Everything here runs on worker threads and holds no UI code; completion
+callbacks are handed back to the Kivy main thread through kivy.clock.
+The desktop app (main.py) reuses the Range probe and parallel downloader.
+"""
+import os
+import re
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import List, Dict, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Shared HTTP session so back-to-back downloads reuse pooled connections
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
+
+# Read size per iteration
+CHUNK_SIZE = 1 << 20
+
+# Number of episodes fetched at once by BatchDownloader
+BATCH_WORKERS = 4
+
+# Files at least this large are fetched as parallel HTTP Range requests
+RANGE_MIN_SIZE = 16 << 20
+RANGE_PARTS = 4
+
+# "bytes <first>-<last>/<size>" from a 206 response
+_CONTENT_RANGE = re.compile(r"bytes\s+(\d+)-(\d+)/(?:\d+|\*)")
+
+
+class RangeIgnored(Exception):
+    """Raised when a Range GET is not answered with exactly the requested bytes."""
+
+
+def check_partial_response(r: requests.Response, start: int, end: int) -> None:
+    """
+    Raises RangeIgnored unless r is a 206 covering bytes start..end.
+
+    A 200 means the server sent the whole file instead; a 206 whose
+    Content-Range differs means it sent some other slice, e.g. one capped
+    at a maximum size.
+    """
+    if r.status_code != 206:
+        raise RangeIgnored(f"Range {start}-{end} answered with HTTP {r.status_code}")
+    m = _CONTENT_RANGE.match(r.headers.get('content-range', ''))
+    if m is None or (int(m.group(1)), int(m.group(2))) != (start, end):
+        raise RangeIgnored(f"Range {start}-{end} answered with {r.headers.get('content-range')!r}")
+
+
+def progress_stats(downloaded: int, total: int, start_time: float):
+    """Return (percent, rate_bps, eta_secs) for a transfer started at start_time."""
+    percent = int((downloaded * 100) // total) if total > 0 else 0
+    elapsed = max(time.time() - start_time, 1e-6)
+    rate = downloaded / elapsed
+    eta = ((total - downloaded) / rate) if (total > 0 and rate > 0) else -1.0
+    return percent, rate, eta
+
+
+class _CancelableRaw:
+    """Read-only wrapper around a raw response stream for shutil.copyfileobj.
+
+    Each read checks stop_flag (returning EOF once cancel is requested) and
+    reports the running byte count through on_chunk.
+    """
+
+    def __init__(self, raw, stop_flag, total_size: int, on_chunk=None):
+        self.raw = raw
+        self.stop_flag = stop_flag
+        self.total_size = total_size
+        self.on_chunk = on_chunk
+        self.bytes_read = 0
+        self.aborted = False
+
+    def read(self, size: int = -1) -> bytes:
+        if self.stop_flag['stop']:
+            self.aborted = True
+            return b''
+        data = self.raw.read(size)
+        if data:
+            self.bytes_read += len(data)
+            if self.on_chunk is not None:
+                self.on_chunk(self.bytes_read, self.total_size)
+        return data
+
+
+def probe_range_size(url: str, session: Optional[requests.Session] = None) -> int:
+    """Returns the file size if the server accepts byte ranges for url, else 0."""
+    try:
+        r = (session or SESSION).head(url, allow_redirects=True, timeout=(5, 30))
+        r.raise_for_status()
+    except requests.RequestException:
+        return 0
+    if r.headers.get('accept-ranges', '').lower() != 'bytes':
+        return 0
+    # Ranges address the encoded body, so only unencoded payloads can be split
+    if r.headers.get('content-encoding'):
+        return 0
+    try:
+        return int(r.headers.get('content-length', 0))
+    except ValueError:
+        return 0
+
+
+def download_stream(url: str, filepath: str, stop_flag, on_chunk=None) -> bool:
+    """Downloads url into filepath over a single streamed GET."""
+    with SESSION.get(url, stream=True, timeout=(5, 30)) as r:
+        r.raise_for_status()
+        total_size = int(r.headers.get('content-length', 0))
+        # The payload has to pass through Python: feeds are served over TLS, so
+        # the socket carries ciphertext and os.sendfile/splice cannot be used.
+        # Undo any transfer encoding so the file gets the real payload
+        r.raw.decode_content = True
+        src = _CancelableRaw(r.raw, stop_flag, total_size, on_chunk)
+        with open(filepath, 'wb') as f:
+            shutil.copyfileobj(src, f, length=CHUNK_SIZE)
+    return not src.aborted
+
+
+def download_ranges(url: str, filepath: str, total_size: int, stop_flag, on_chunk=None,
+                    parts: int = RANGE_PARTS, session: Optional[requests.Session] = None) -> bool:
+    """Downloads url into filepath as `parts` concurrent HTTP Range requests.
+
+    The file is sized up front and each worker writes its own disjoint byte
+    range through a separate handle, so no write locking is needed.
+    Raises RangeIgnored if the server does not honour a range, and OSError
+    if a range ends early, so True is only returned for a complete file.
+    session defaults to the shared SESSION.
+    """
+    session = session or SESSION
+    with open(filepath, 'wb') as f:
+        f.truncate(total_size)
+
+    step = -(-total_size // parts)
+    ranges = [(start, min(start + step, total_size) - 1) for start in range(0, total_size, step)]
+    lock = threading.Lock()
+    failed = threading.Event()
+    downloaded = 0
+
+    def fetch(byte_range: Tuple[int, int]) -> bool:
+        nonlocal downloaded
+        start, end = byte_range
+        try:
+            # Slices are written from r.raw as-is, so they must not be compressed
+            headers = {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+            with session.get(url, headers=headers, stream=True, timeout=(5, 30)) as r:
+                r.raise_for_status()
+                check_partial_response(r, start, end)
+                expected = end - start + 1
+                received = 0
+                with open(filepath, 'r+b') as f:
+                    f.seek(start)
+                    while True:
+                        if stop_flag['stop'] or failed.is_set():
+                            return False
+                        chunk = r.raw.read(CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        received += len(chunk)
+                        if received > expected:
+                            raise OSError(f"Range {start}-{end} sent more than {expected} bytes")
+                        f.write(chunk)
+                        with lock:
+                            downloaded += len(chunk)
+                            if on_chunk is not None:
+                                on_chunk(downloaded, total_size)
+                if received != expected:
+                    raise OSError(f"Range {start}-{end} ended after {received} of {expected} bytes")
+                return True
+        except Exception:
+            # Stop the sibling ranges early; the error is re-raised below
+            failed.set()
+            raise
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [executor.submit(fetch, byte_range) for byte_range in ranges]
+        results = [fut.result() for fut in futures]
+    return all(results)
+
+
+def remove_partial(filepath: str) -> None:
+    """Deletes an incomplete download, ignoring a file that is already gone."""
+    try:
+        os.remove(filepath)
+    except OSError:
+        # Already gone, or not removable; either way nothing more to do
+        pass
+
+
+def download_one(url: str, filepath: str, stop_flag, on_chunk=None) -> bool:
+    """Download url into filepath using the shared SESSION.
+
+    Large files on servers that accept byte ranges are split across parallel
+    Range requests; everything else is streamed over one GET. The HEAD probe
+    is only a hint, so a server that then ignores the ranges is streamed too.
+    on_chunk(bytes_downloaded, total_size) is called after every chunk.
+    Returns False if canceled through stop_flag. Network and file errors are
+    raised. In both cases the partial file is removed, so a file left at
+    filepath is always complete.
+    """
+    if stop_flag['stop']:
+        return False
+    try:
+        total_size = probe_range_size(url)
+        completed = None
+        if total_size >= RANGE_MIN_SIZE:
+            try:
+                completed = download_ranges(url, filepath, total_size, stop_flag, on_chunk)
+            except RangeIgnored:
+                completed = None
+        if completed is None:
+            completed = download_stream(url, filepath, stop_flag, on_chunk)
+    except BaseException:
+        remove_partial(filepath)
+        raise
+
+    if not completed:
+        remove_partial(filepath)
+        return False
+    return True
+
+
+def _on_ui_thread(callback, *args) -> None:
+    """Runs callback(*args) on the Kivy main thread; kivy.clock is only imported when needed."""
+    from kivy.clock import Clock
+    Clock.schedule_once(lambda dt: callback(*args))
+
+
+class Progress:
+    """Latest download progress, written by worker threads and read by the UI pump.
+
+    Workers only store plain counters here; the UI polls it on a Clock
+    interval, so nothing is scheduled per chunk.
+    """
+    __slots__ = ("start_time", "downloaded", "total")
+
+    def __init__(self) -> None:
+        self.start_time = time.time()
+        self.downloaded = 0
+        self.total = 0
+
+
+class DownloaderThread(threading.Thread):
+    def __init__(self, url: str, filepath: str, progress: Progress, done_cb, error_cb, stop_flag):
+        super().__init__(daemon=True)
+        self.url = url
+        self.filepath = filepath
+        self.progress = progress
+        self.done_cb = done_cb
+        self.error_cb = error_cb
+        self.stop_flag = stop_flag
+
+    def _on_chunk(self, downloaded: int, total: int):
+        self.progress.downloaded = downloaded
+        self.progress.total = total
+
+    def run(self):
+        try:
+            if download_one(self.url, self.filepath, self.stop_flag, self._on_chunk):
+                _on_ui_thread(self.done_cb)
+            else:
+                _on_ui_thread(self.error_cb, "Canceled")
+        except Exception as e:
+            _on_ui_thread(self.error_cb, str(e))
+
+
+class BatchDownloader(threading.Thread):
+    """Downloads several (url, filepath) jobs concurrently over the shared SESSION.
+
+    Progress is accumulated into one Progress across all jobs, the same way
+    DownloaderThread reports a single file.
+    """
+
+    def __init__(self, jobs: List[Tuple[str, str]], progress: Progress, done_cb, error_cb, stop_flag,
+                 max_workers: int = BATCH_WORKERS):
+        super().__init__(daemon=True)
+        self.jobs = list(jobs)
+        self.progress = progress
+        self.done_cb = done_cb
+        self.error_cb = error_cb
+        self.stop_flag = stop_flag
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._downloaded: Dict[int, int] = {}
+        self._totals: Dict[int, int] = {}
+
+    def _on_chunk(self, index: int, downloaded: int, total: int):
+        with self._lock:
+            self.progress.downloaded += downloaded - self._downloaded.get(index, 0)
+            self._downloaded[index] = downloaded
+            if index not in self._totals:
+                self._totals[index] = total
+                # Overall size is only known once every job has reported its length
+                if len(self._totals) == len(self.jobs) and all(self._totals.values()):
+                    self.progress.total = sum(self._totals.values())
+
+    def _download_job(self, index: int, job: Tuple[str, str]) -> bool:
+        url, filepath = job
+        return download_one(url, filepath, self.stop_flag, partial(self._on_chunk, index))
+
+    def run(self):
+        canceled = False
+        errors: List[str] = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self._download_job, i, job) for i, job in enumerate(self.jobs)]
+            for fut in futures:
+                try:
+                    if not fut.result():
+                        canceled = True
+                except Exception as e:
+                    errors.append(str(e))
+        if canceled:
+            _on_ui_thread(self.error_cb, "Canceled")
+        elif errors:
+            _on_ui_thread(self.error_cb, f"{len(errors)} of {len(self.jobs)} downloads failed: {errors[0]}")
+        else:
+            _on_ui_thread(self.done_cb)
@@ -0,0 +1,46 @@
+import json
+import os
+import tempfile
+from typing import Any, Dict
+
+# One cache root for every script in the project
+CACHE_DIR = os.path.join(os.path.expanduser("~/.cache"), "clubtwitshows")
+
+
+def cache_path(name: str) -> str:
+    """Returns the path of the cache file called name under CACHE_DIR."""
+    return os.path.join(CACHE_DIR, name)
+
+
+def load_json(path: str) -> Dict[str, Any]:
+    """Returns the JSON object cached at path, or an empty dict if unavailable."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_json(path: str, data: Dict[str, Any]) -> None:
+    """
+    Atomically writes data as JSON to path.
+
+    The file is written next to path and then renamed over it, so readers
+    never see a half-written cache. Caching is best effort; failures are
+    ignored.
+    """
+    cache_dir = os.path.dirname(path)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
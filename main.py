@@ -1,39 +1,161 @@
 import sys
 import os
-import requests
-from typing import List, Dict, Any
+import math
+import queue
+import re
+import threading
+import time
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
+from urllib.parse import urlparse
 
 from PySide6.QtWidgets import (
-    QApplication, QMainWindow, QTableWidget, QTableWidgetItem,
+    QApplication, QMainWindow, QTableView, QAbstractItemView,
     QPushButton, QVBoxLayout, QWidget, QHeaderView, QTextBrowser,
     QSplitter, QProgressBar, QFileDialog, QMessageBox, QInputDialog
 )
-from PySide6.QtGui import QShortcut, QKeySequence
+from PySide6.QtGui import QShortcut, QKeySequence, QBrush
 from PySide6.QtCore import (
-    Qt, QThread, QObject, Signal, Slot
+    Qt, QThread, QObject, Signal, Slot, QAbstractTableModel, QModelIndex,
+    QSortFilterProxyModel, QTimer
 )
 
-from clubtwit import ClubTwit
+from jsoncache import cache_path, load_json, save_json
+from sortkeys import add_sort_keys
 
+# Download read size and seconds between UI progress refreshes
+CHUNK_SIZE = 1 << 18
+PROGRESS_INTERVAL = 0.1
+# Chunks buffered between the network reader and the disk writer thread
+WRITE_QUEUE_SIZE = 16
 
-class SortableTableWidgetItem(QTableWidgetItem):
-    """QTableWidgetItem with a custom sort key to support numeric/date sorting."""
-    def __init__(self, text: str, sort_key):
-        super().__init__(text)
-        self._sort_key = sort_key
+# Anything other than letters, digits, '_', ' ' and '.' is dropped from file names
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w .]")
 
-    def __lt__(self, other):  # type: ignore[override]
-        try:
-            if isinstance(other, SortableTableWidgetItem):
-                return self._sort_key < other._sort_key
-        except Exception:
-            pass
-        return super().__lt__(other)
+# Status bar units and the longest ETA shown (99:59:59)
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+_MAX_ETA_SECS = 99 * 3600 + 59 * 60 + 59
+
+
+# Parsed feed plus its ETag/Last-Modified, so an unchanged feed costs one 304
+FEED_CACHE_PATH = cache_path("shows.json")
+
+
+# Item data role carrying the precomputed sort key of a cell. Keys are plain
+# ints/strs so QSortFilterProxyModel compares them in C++ without calling back
+# into Python.
+SORT_ROLE = int(Qt.ItemDataRole.UserRole) + 1
+
+
+@lru_cache(maxsize=None)
+def _session():
+    """
+    Returns the shared HTTP session: pooled keep-alive connections plus retries on 5xx.
+
+    requests (and urllib3/ssl behind it) is imported here, on the first
+    worker thread that needs it, so the window can open without paying for it.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class ShowsModel(QAbstractTableModel):
+    """
+    Read-only table model over the list of show dictionaries.
+
+    Sort keys and the size string are computed once per show on the fetch
+    thread (see sortkeys.add_sort_keys), so data() is a plain list lookup and
+    sorting compares native values. Tooltips are read from the show's
+    description on request rather than stored per cell.
+    """
+    HEADERS = ("Publication Date", "Size (MB)", "Title")
+
+    def __init__(self, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self._rows: List[Dict[str, Any]] = []
+        self._display: List[Tuple[str, str, str]] = []
+        self._keys: List[Tuple[int, int, str]] = []
+        self._sorted_column: int = -1
+        self._sorted_brush = QBrush(Qt.GlobalColor.green)
+
+    def setShows(self, shows: List[Dict[str, Any]]) -> None:
+        """
+        Replaces the model contents with shows prepared by add_sort_keys().
+
+        Display tuples and sort keys are built before the reset, so views see a
+        single model reset with no per-cell updates.
+        """
+        display = [(s["PubDate"] or "", s["_mb"], s["Title"] or "") for s in shows]
+        keys = [(s["_ts"], s["_len"], s["_title_key"]) for s in shows]
+
+        self.beginResetModel()
+        self._rows = shows
+        self._display = display
+        self._keys = keys
+        self.endResetModel()
+
+    def show_at(self, row: int) -> Dict[str, Any]:
+        """Returns the show dictionary for a source row, or {} if out of range."""
+        return self._rows[row] if 0 <= row < len(self._rows) else {}
+
+    def set_sorted_column(self, column: int) -> None:
+        """Marks the column whose header should be highlighted as sorted."""
+        if column == self._sorted_column:
+            # Nothing to repaint; sort-order toggles on the same column land here
+            return
+        self._sorted_column = column
+        self.headerDataChanged.emit(Qt.Orientation.Horizontal, 0, len(self.HEADERS) - 1)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[row][index.column()]
+        if role == SORT_ROLE:
+            return self._keys[row][index.column()]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self._rows[row].get("Description") or "No description available."
+        if role == Qt.ItemDataRole.UserRole:
+            return self._rows[row]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation,
+                   role: int = Qt.ItemDataRole.DisplayRole):  # type: ignore[override]
+        if orientation != Qt.Orientation.Horizontal or not 0 <= section < len(self.HEADERS):
+            return None
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        if role == Qt.ItemDataRole.ForegroundRole and section == self._sorted_column:
+            # Highlight the sorted column header in green
+            return self._sorted_brush
+        return None
 
 
 class ShowFetcher(QObject):
     """
     Worker object to fetch show data in a separate thread.
+
+    The parsed show list, sort keys included, is cached on disk together with
+    the feed's validators. When the server reports the feed unchanged, the
+    cached list is used without parsing anything.
     """
     finished = Signal(list)
     error = Signal(str)
@@ -43,12 +165,24 @@ class ShowFetcher(QObject):
         Executes the fetching process.
         """
         try:
-            ct = ClubTwit()
+            # clubtwit pulls in requests; it is only needed once fetching starts
+            from clubtwit import ClubTwit
+            ct = ClubTwit(session=_session())
             if not ct.clubtwit_url:
                 # Prompt user for URL if not set
                 self.error.emit("NO_URL")
                 return
+            cache = load_json(FEED_CACHE_PATH)
+            cached_shows = cache.get("shows")
+            if isinstance(cached_shows, list) and isinstance(cache.get("state"), dict):
+                ct.restore_cache_state(cache["state"], cached_shows)
+            else:
+                cached_shows = None
             shows = ct.fetch_shows()
+            # A 304 hands back the cached list, which already carries its sort keys
+            if shows is not cached_shows:
+                add_sort_keys(shows)
+                save_json(FEED_CACHE_PATH, {"state": ct.cache_state(), "shows": shows})
             self.finished.emit(shows)
         except Exception as e:
             self.error.emit(str(e))
@@ -57,12 +191,11 @@ class ShowFetcher(QObject):
 class Downloader(QObject):
     """
     Worker object to download a file in a separate thread.
+
+    Progress is not signalled per chunk. The worker only records the latest
+    byte counts, and the UI polls latest_progress() on a timer, so a busy UI
+    thread never builds up a backlog of queued progress events.
     """
-    # Basic percentage progress for backward compatibility
-    progress = Signal(int)
-    # Detailed progress: percent, bytes_downloaded, total_bytes, rate_bytes_per_sec, eta_seconds
-    # Use 'object' for large byte counts to avoid Qt int overflow on very large downloads.
-    progress_detail = Signal(int, object, object, float, float)
     finished = Signal()
     error = Signal(str)
 
@@ -70,50 +203,150 @@ class Downloader(QObject):
         super().__init__()
         self.url = url
         self.filepath = filepath
-        self._abort = False
+        # Shared with the Range workers in downloads.download_ranges
+        self._stop_flag = {'stop': False}
+        self._start_time = 0.0
+        self._progress_lock = threading.Lock()
+        self._downloaded = 0
+        self._total = 0
 
     def cancel(self) -> None:
         """Requests cooperative cancellation of the download."""
-        self._abort = True
+        self._stop_flag['stop'] = True
 
-    def run(self) -> None:
+    @staticmethod
+    def _preallocate(f, size: int) -> None:
         """
-        Executes the download process.
+        Sizes f to size bytes up front with a sparse truncate.
+
+        posix_fallocate is deliberately not used: on filesystems without
+        fallocate support glibc emulates it by writing zeros block by block,
+        which is very slow on FUSE/NFS targets such as external drives.
         """
-        try:
-            import time
-            start_time = time.time()
-            aborted = False
-            with requests.get(self.url, stream=True) as r:
-                r.raise_for_status()
-                total_size = int(r.headers.get('content-length', 0))
-                bytes_downloaded = 0
-                with open(self.filepath, 'wb') as f:
-                    for chunk in r.iter_content(chunk_size=8192):
-                        if self._abort:
-                            aborted = True
+        f.truncate(size)
+
+    @staticmethod
+    def _write_loop(f, chunks: "queue.Queue[Optional[bytes]]", errors: List[BaseException]) -> None:
+        """Writes queued chunks to f until a None sentinel arrives.
+
+        After a write error the remaining chunks are drained and dropped so the
+        reader never blocks on a full queue; the error is left in errors.
+        """
+        while True:
+            chunk = chunks.get()
+            if chunk is None:
+                return
+            if errors:
+                continue
+            try:
+                f.write(chunk)
+            except BaseException as e:
+                errors.append(e)
+
+    def _report(self, bytes_downloaded: int, total_size: int) -> None:
+        """Records the latest progress for latest_progress() to pick up."""
+        with self._progress_lock:
+            self._downloaded = bytes_downloaded
+            self._total = total_size
+
+    def latest_progress(self) -> Tuple[int, int, int, float, float]:
+        """
+        Returns a progress snapshot, safe to call from any thread.
+
+        The tuple is (percent, bytes_downloaded, total_bytes, rate_bytes_per_sec,
+        eta_seconds); percent is 0 and eta is -1 while the total size is unknown.
+        """
+        with self._progress_lock:
+            bytes_downloaded, total_size = self._downloaded, self._total
+        # Calculate percentage if total size known
+        percentage = int((bytes_downloaded * 100) // total_size) if total_size > 0 else 0
+        # Calculate rate and ETA
+        elapsed = max(time.time() - self._start_time, 1e-6)
+        rate = bytes_downloaded / elapsed
+        eta = ((total_size - bytes_downloaded) / rate) if (total_size > 0 and rate > 0) else -1.0
+        return percentage, bytes_downloaded, total_size, float(rate), float(eta)
+
+    def _download_stream(self) -> bool:
+        """Downloads the URL over a single streamed GET; returns False if canceled."""
+        # Media is already compressed; ask for it as-is
+        with _session().get(self.url, stream=True, headers={'Accept-Encoding': 'identity'},
+                            timeout=(5, 60)) as r:
+            r.raise_for_status()
+            total_size = int(r.headers.get('content-length', 0))
+            bytes_downloaded = 0
+            # A large write buffer coalesces chunks into fewer write() calls
+            with open(self.filepath, 'wb', buffering=1 << 20) as f:
+                if total_size > 0:
+                    self._preallocate(f, total_size)
+                # Disk writes run on their own thread so a slow disk does not
+                # stall draining the socket; the bounded queue caps memory use.
+                # An io_uring recv->write pipeline is not an option: the media is
+                # served over TLS, so the socket carries ciphertext that only the
+                # ssl module can decrypt in userspace.
+                chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+                write_errors: List[BaseException] = []
+                writer = threading.Thread(target=self._write_loop, args=(f, chunks, write_errors), daemon=True)
+                writer.start()
+                try:
+                    for chunk in r.iter_content(chunk_size=CHUNK_SIZE):
+                        if self._stop_flag['stop']:
+                            return False
+                        if write_errors:
                             break
                         if not chunk:
                             continue
-                        f.write(chunk)
+                        chunks.put(chunk)
                         bytes_downloaded += len(chunk)
-                        # Calculate percentage if total size known
-                        percentage = int((bytes_downloaded * 100) // total_size) if total_size > 0 else 0
-                        # Calculate rate and ETA
-                        elapsed = max(time.time() - start_time, 1e-6)
-                        rate = bytes_downloaded / elapsed
-                        eta = ((total_size - bytes_downloaded) / rate) if (total_size > 0 and rate > 0) else -1.0
-                        # Emit signals
-                        if total_size > 0:
-                            self.progress.emit(percentage)
-                        self.progress_detail.emit(percentage, bytes_downloaded, total_size, float(rate), float(eta))
-            if aborted:
-                # Clean up partial file
-                try:
-                    if os.path.exists(self.filepath):
-                        os.remove(self.filepath)
-                except Exception:
-                    pass
+                        self._report(bytes_downloaded, total_size)
+                finally:
+                    chunks.put(None)
+                    writer.join()
+                if write_errors:
+                    raise write_errors[0]
+                if bytes_downloaded < total_size:
+                    # Drop the unused preallocated tail
+                    f.truncate(bytes_downloaded)
+        return True
+
+    def _remove_partial(self) -> None:
+        """Deletes the incomplete download, ignoring a file that is already gone."""
+        try:
+            os.remove(self.filepath)
+        except OSError:
+            # Already gone, or not removable; either way nothing more to do
+            pass
+
+    def _download(self) -> bool:
+        """Downloads the URL, in parallel ranges when the server allows it; False if canceled."""
+        # Imported here with requests behind it, off the UI thread (see _session)
+        from downloads import RANGE_MIN_SIZE, RangeIgnored, download_ranges, probe_range_size
+
+        total_size = probe_range_size(self.url, session=_session())
+        if total_size >= RANGE_MIN_SIZE:
+            try:
+                # Parallel Range requests, each checked against its Content-Range
+                return download_ranges(self.url, self.filepath, total_size, self._stop_flag,
+                                       self._report, session=_session())
+            except RangeIgnored:
+                # The HEAD probe is only a hint; fetch the body in one stream instead
+                self._report(0, 0)
+        return self._download_stream()
+
+    def run(self) -> None:
+        """
+        Executes the download process.
+
+        A canceled or failed download never leaves a partial file behind.
+        """
+        try:
+            self._start_time = time.time()
+            try:
+                completed = self._download()
+            except BaseException:
+                self._remove_partial()
+                raise
+            if not completed:
+                self._remove_partial()
                 self.error.emit("Canceled")
             else:
                 self.finished.emit()
@@ -165,11 +398,16 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(False)
         self.layout.addWidget(self.progress_bar)
 
+        # Polls the active download's progress while one is running
+        self.progress_timer = QTimer(self)
+        self.progress_timer.setInterval(int(PROGRESS_INTERVAL * 1000))
+        self.progress_timer.timeout.connect(self._poll_download_progress)
+
         # Status bar
         self.statusBar().showMessage("Ready")
 
         # Connect signals to slots
-        self.table.itemSelectionChanged.connect(self.on_selection_changed)
+        self.table.selectionModel().selectionChanged.connect(self.on_selection_changed)
         self.download_button.clicked.connect(self.start_download)
         self.quit_button.clicked.connect(self.quit_app)
 
@@ -183,35 +421,33 @@ class MainWindow(QMainWindow):
             pass
 
     def _setup_table(self) -> None:
-        """Initializes and configures the QTableWidget."""
-        self.table = QTableWidget()
-        self.table.setColumnCount(3)
-        self.table.setHorizontalHeaderLabels(["Publication Date", "Size (MB)", "Title"])
-        self.table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.table.setEditTriggers(QTableWidget.EditTriggers.NoEditTriggers)
+        """Initializes the QTableView with the shows model behind a sorting proxy."""
+        self.shows_model = ShowsModel(self)
+        self.proxy_model = QSortFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.shows_model)
+        # Sort on the precomputed keys so Qt compares native values
+        self.proxy_model.setSortRole(SORT_ROLE)
+
+        self.table = QTableView()
+        self.table.setModel(self.proxy_model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
         header = self.table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
-        # Enable sorting by clicking on headers; Qt toggles order on repeated clicks
-        self.table.setSortingEnabled(True)
+        # Sorting is only enabled once data arrives (see populate_table); turning it
+        # on here would sort the empty model now and again on the first load
         header.setSortIndicatorShown(True)
-        # Connect to update header colors based on sorted column
+        header.setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        # Connect to update header colors based on sorted column. This happens after
+        # the indicator is set so that programmatic change runs no slot; the model
+        # starts with no highlighted column, matching the -1 indicator.
         try:
             header.sortIndicatorChanged.connect(self._update_sorted_column_header_color)
         except Exception:
             pass
-        # Apply initial sort: Publication Date (column 0), newest first
-        try:
-            header.setSortIndicator(0, Qt.SortOrder.DescendingOrder)
-        except Exception:
-            pass
-        # Apply initial header coloring
-        try:
-            self._update_sorted_column_header_color()
-        except Exception:
-            pass
         self.splitter.addWidget(self.table)
 
     def load_shows(self) -> None:
@@ -241,57 +477,22 @@ class MainWindow(QMainWindow):
         """
         if self._is_shutting_down:
             return
-        # Prevent auto-sorting jitter while filling
-        was_sorting = self.table.isSortingEnabled()
-        if was_sorting:
-            self.table.setSortingEnabled(False)
         self.shows_data = shows
-        self.table.setRowCount(len(shows))
-        for row, show in enumerate(shows):
-            title_text = show.get("Title") or ""
-            title_item = SortableTableWidgetItem(title_text, title_text.casefold())
-            title_item.setData(Qt.ItemDataRole.UserRole, show)
-
-            pub_text = show.get("PubDate") or ""
-            ts = 0.0
-            try:
-                from email.utils import parsedate_to_datetime
-                dt = parsedate_to_datetime(pub_text)
-                if dt is not None:
-                    ts = dt.timestamp()
-            except Exception:
-                ts = 0.0
-            pub_item = SortableTableWidgetItem(pub_text, ts)
-
+        self.shows_model.setShows(shows)
+        self.statusBar().showMessage(f"Loaded {len(shows)} shows.")
+        # First load: sort once by Publication Date (column 0), newest first, then
+        # let Qt handle header clicks. Enabling sorting performs that single sort;
+        # later reloads are re-sorted by the proxy in the user's current order.
+        if not self.table.isSortingEnabled():
             try:
-                length_bytes = int(show.get("Length", 0) or 0)
+                header = self.table.horizontalHeader()
+                # Only touch the indicator if needed; each change re-runs the header slot
+                if (header.sortIndicatorSection() != 0
+                        or header.sortIndicatorOrder() != Qt.SortOrder.DescendingOrder):
+                    header.setSortIndicator(0, Qt.SortOrder.DescendingOrder)
+                self.table.setSortingEnabled(True)
             except Exception:
-                length_bytes = 0
-            size_mb = f"{length_bytes / (1024 * 1024):.2f}"
-            size_item = SortableTableWidgetItem(size_mb, length_bytes)
-
-            # Set tooltips with the show's description on all cells in this row
-            desc = show.get("Description") or "No description available."
-            title_item.setToolTip(desc)
-            pub_item.setToolTip(desc)
-            size_item.setToolTip(desc)
-
-            self.table.setItem(row, 0, pub_item)
-            self.table.setItem(row, 1, size_item)
-            self.table.setItem(row, 2, title_item)
-        self.statusBar().showMessage(f"Loaded {len(shows)} shows.")
-        if was_sorting:
-            self.table.setSortingEnabled(True)
-        # Ensure initial sort by Publication Date (column 0), newest first
-        try:
-            self.table.sortByColumn(0, Qt.SortOrder.DescendingOrder)
-        except Exception:
-            pass
-        # Re-apply header color after (re)population
-        try:
-            self._update_sorted_column_header_color()
-        except Exception:
-            pass
+                pass
 
     @Slot(str)
     def on_fetch_error(self, error_message: str) -> None:
@@ -320,27 +521,27 @@ class MainWindow(QMainWindow):
         else:
             self.statusBar().showMessage("Cannot load shows without a URL.")
 
+    def _selected_show(self) -> Optional[Dict[str, Any]]:
+        """Returns the show for the selected table row, or None if nothing is selected."""
+        selected_rows = self.table.selectionModel().selectedRows()
+        if not selected_rows:
+            return None
+        source_index = self.proxy_model.mapToSource(selected_rows[0])
+        return self.shows_model.show_at(source_index.row())
+
     @Slot()
     def on_selection_changed(self) -> None:
         """
         Updates the description and enables the download button when a show is selected.
         Also copies the episode URL to the clipboard as text.
         """
-        selected_rows = self.table.selectionModel().selectedRows()
-        if selected_rows:
-            selected_row = selected_rows[0].row()
-            title_item = self.table.item(selected_row, 2)
-            show = None
-            if title_item is not None:
-                show = title_item.data(Qt.ItemDataRole.UserRole)
-            if not isinstance(show, dict):
-                # Fallback to legacy mapping by row index
-                show = self.shows_data[selected_row] if 0 <= selected_row < len(self.shows_data) else {}
+        show = self._selected_show()
+        if show is not None:
             description = show.get("Description", "No description available.")
             self.description_browser.setText(description)
             # Copy URL to clipboard if available
             try:
-                link = show.get("Link") if isinstance(show, dict) else None
+                link = show.get("Link")
                 if link:
                     QApplication.clipboard().setText(str(link))
             except Exception:
@@ -355,18 +556,8 @@ class MainWindow(QMainWindow):
         """
         Starts the download process for the selected show.
         """
-        selected_rows = self.table.selectionModel().selectedRows()
-        if not selected_rows:
-            return
-
-        selected_row = selected_rows[0].row()
-        title_item = self.table.item(selected_row, 2)
-        show_to_download = None
-        if title_item is not None:
-            show_to_download = title_item.data(Qt.ItemDataRole.UserRole)
-        if not isinstance(show_to_download, dict):
-            show_to_download = self.shows_data[selected_row] if 0 <= selected_row < len(self.shows_data) else None
-        if not isinstance(show_to_download, dict):
+        show_to_download = self._selected_show()
+        if not show_to_download:
             return
         download_url = show_to_download.get("Link")
         self.current_download_title = show_to_download.get("Title", "")
@@ -376,8 +567,9 @@ class MainWindow(QMainWindow):
             return
 
         # Sanitize filename
-        filename = "".join(c for c in show_to_download['Title'] if c.isalnum() or c in (' ', '.', '_')).rstrip()
-        filename += os.path.splitext(download_url)[1] or ".mp4"
+        filename = _UNSAFE_FILENAME_CHARS.sub("", show_to_download['Title']).rstrip()
+        # Take the extension from the URL path so a query string cannot supply it
+        filename += os.path.splitext(urlparse(download_url).path)[1] or ".mp4"
 
         save_path, _ = QFileDialog.getSaveFileName(self, "Save File", filename)
 
@@ -395,9 +587,6 @@ class MainWindow(QMainWindow):
         self.downloader.moveToThread(self.download_thread)
 
         self.download_thread.started.connect(self.downloader.run)
-        self.downloader.progress.connect(self.update_progress)
-        # New detailed progress connection for rate and ETA display
-        self.downloader.progress_detail.connect(self.update_progress_detail)
         self.downloader.finished.connect(self.on_download_finished)
         self.downloader.error.connect(self.on_download_error)
         # Ensure cleanup and thread exit on error as well
@@ -409,15 +598,23 @@ class MainWindow(QMainWindow):
         self.download_thread.finished.connect(self.download_thread.deleteLater)
 
         self.download_thread.start()
+        # Progress is polled from the downloader rather than signalled per chunk
+        self.progress_timer.start()
 
-    @Slot(int)
-    def update_progress(self, value: int) -> None:
-        """Updates the progress bar only (legacy)."""
-        if self._is_shutting_down:
+    @Slot()
+    def _poll_download_progress(self) -> None:
+        """Refreshes the progress display from the active downloader's latest snapshot."""
+        downloader = getattr(self, "downloader", None)
+        if downloader is None:
             return
-        self.progress_bar.setValue(value)
+        try:
+            snapshot = downloader.latest_progress()
+        except RuntimeError:
+            # The downloader was already deleted
+            self.progress_timer.stop()
+            return
+        self.update_progress_detail(*snapshot)
 
-    @Slot(int, object, object, float, float)
     def update_progress_detail(self, percent: int, downloaded: int, total: int, rate_bps: float, eta_secs: float) -> None:
         """Updates the progress bar and displays rate and ETA in the status bar."""
         if self._is_shutting_down:
@@ -439,39 +636,31 @@ class MainWindow(QMainWindow):
 
     def _format_bytes(self, num_bytes: float) -> str:
         """Formats a byte count into a human-readable string."""
-        units = ["B", "KB", "MB", "GB", "TB"]
         size = float(num_bytes)
-        for unit in units:
-            if size < 1024.0 or unit == units[-1]:
-                return f"{size:.2f} {unit}"
-            size /= 1024.0
-        return f"{size:.2f} TB"
+        if not math.isfinite(size):
+            return f"{size:.2f} TB"
+        # Pick the unit directly from the magnitude (each unit is 2**10 larger)
+        i = max(0, min(len(_UNITS) - 1, (int(size).bit_length() - 1) // 10))
+        return f"{size / (1 << (10 * i)):.2f} {_UNITS[i]}"
 
     def _format_time(self, seconds: float) -> str:
         """Formats seconds into H:MM:SS or M:SS, guarding against overflow/non-finite values."""
         try:
-            import math
             # Return placeholder for invalid or negative ETA values
             if not math.isfinite(seconds) or seconds < 0:
                 return "--:--"
-            # Cap to a sane upper bound to avoid absurdly large times (99:59:59)
-            max_secs = 99 * 3600 + 59 * 60 + 59
-            secs_f = min(float(seconds), float(max_secs))
-            # Round safely without using round() on potentially huge floats
-            secs = int(secs_f + 0.5)
+            # Cap to a sane upper bound to avoid absurdly large times
+            secs = int(min(float(seconds), float(_MAX_ETA_SECS)) + 0.5)
         except Exception:
             return "--:--"
-        h = secs // 3600
-        m = (secs % 3600) // 60
-        s = secs % 60
-        if h > 0:
-            return f"{h}:{m:02d}:{s:02d}"
-        else:
-            return f"{m}:{s:02d}"
+        h, rem = divmod(secs, 3600)
+        m, s = divmod(rem, 60)
+        return f"{h}:{m:02d}:{s:02d}" if h > 0 else f"{m}:{s:02d}"
 
     @Slot()
     def on_download_finished(self) -> None:
         """Handles successful download completion."""
+        self.progress_timer.stop()
         if self._is_shutting_down:
             return
         self.statusBar().showMessage("Download complete.")
@@ -482,6 +671,7 @@ class MainWindow(QMainWindow):
     @Slot(str)
     def on_download_error(self, error_msg: str) -> None:
         """Handles download errors."""
+        self.progress_timer.stop()
         if self._is_shutting_down:
             return
         self.statusBar().showMessage("Download failed.")
@@ -516,26 +706,10 @@ class MainWindow(QMainWindow):
     def _update_sorted_column_header_color(self, logicalIndex: int | None = None, order: Qt.SortOrder | None = None) -> None:
         """Set the sorted column header text color to green and reset others."""
         try:
-            header = self.table.horizontalHeader()
-            # Determine current sorted column from header if not provided
-            sorted_col = header.sortIndicatorSection()
+            sorted_col = self.table.horizontalHeader().sortIndicatorSection()
             if sorted_col is None or sorted_col < 0:
                 sorted_col = -1
-            # Ensure header items exist so we can set brush
-            col_count = self.table.columnCount()
-            for c in range(col_count):
-                item = self.table.horizontalHeaderItem(c)
-                if item is None:
-                    # Create a header item based on current label
-                    label = self.table.model().headerData(c, Qt.Orientation.Horizontal)
-                    item = QTableWidgetItem(str(label) if label is not None else "")
-                    self.table.setHorizontalHeaderItem(c, item)
-                # Apply color: green for sorted column, default for others
-                if c == sorted_col:
-                    item.setForeground(Qt.GlobalColor.green)
-                else:
-                    # Reset to default by clearing the brush (use black from palette role if needed)
-                    item.setForeground(self.palette().windowText())
+            self.shows_model.set_sorted_column(sorted_col)
         except Exception:
             pass
 
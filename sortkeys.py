@@ -0,0 +1,66 @@
+"""
+Sort keys for the desktop show table, computed on the fetch thread.
+
+Kept free of Qt so it can be imported and tested without PySide6.
+"""
+import calendar
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List
+
+# RFC 822 month names and the zone names that mean UTC
+_MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+_UTC_ZONES = frozenset(("GMT", "UT", "UTC", "Z"))
+
+
+def pubdate_timestamp(pub_date: str) -> int:
+    """
+    Converts an RSS pubDate to integer epoch seconds, or 0 if unparseable.
+
+    Dates in the usual 'Wed, 01 Jan 2025 12:34:56 +0000' form are parsed by
+    hand without building a datetime; anything else, including two-digit
+    years and out-of-range fields, goes through
+    email.utils.parsedate_to_datetime.
+    """
+    try:
+        _dow, day, mon, year, hms, tz = pub_date.split()
+        if len(year) != 4 or len(hms) != 8 or hms[2] != ":" or hms[5] != ":":
+            raise ValueError(pub_date)
+        y, m, d = int(year), _MONTHS[mon], int(day)
+        hh, mm, ss = int(hms[0:2]), int(hms[3:5]), int(hms[6:8])
+        if not (1 <= d <= calendar.monthrange(y, m)[1] and hh < 24 and mm < 60 and ss < 60):
+            raise ValueError(pub_date)
+        ts = calendar.timegm((y, m, d, hh, mm, ss))
+        if tz in _UTC_ZONES:
+            return ts
+        if len(tz) != 5 or tz[0] not in "+-" or not tz[1:].isdigit():
+            raise ValueError(tz)
+        return ts - (int(tz[:3]) * 3600 + int(tz[0] + tz[3:5]) * 60)
+    except (ValueError, KeyError):
+        pass
+    try:
+        dt = parsedate_to_datetime(pub_date)
+        return int(dt.timestamp()) if dt is not None else 0
+    except Exception:
+        return 0
+
+
+def add_sort_keys(shows: List[Dict[str, Any]]) -> None:
+    """
+    Caches per-show sort keys and display values on each show dict.
+
+    Adds _ts (publication time as integer epoch seconds), _len (size in bytes), _mb (size
+    string in MB) and _title_key (casefolded title). Run on the fetch
+    thread so the UI never parses dates.
+    """
+    for show in shows:
+        try:
+            length_bytes = int(show.get("Length", 0) or 0)
+        except Exception:
+            length_bytes = 0
+        show["_ts"] = pubdate_timestamp(show.get("PubDate") or "")
+        show["_len"] = length_bytes
+        show["_mb"] = f"{length_bytes / (1024 * 1024):.2f}"
+        show["_title_key"] = (show.get("Title") or "").casefold()
@@ -0,0 +1,31 @@
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+pytest.importorskip("lxml")
+
+from clubtwit import _first_paragraph_text, _parse_description_html  # noqa: E402
+
+
+@pytest.mark.parametrize("description_html", [
+    "<p>one</p><p>two</p>",
+    "<p class='intro'>one <b>bold</b> &amp; more</p>",
+    "<p>one<p>two</p>",
+    "<P>one<P class='x'>two",
+    "<div>intro</div><p>one</p>",
+])
+def test_first_paragraph_matches_html_parse(description_html: str) -> None:
+    assert _first_paragraph_text(description_html) == _parse_description_html(description_html)
+
+
+def test_parse_xml_items_outside_channel() -> None:
+    from clubtwit import ClubTwit
+
+    feed = b"""<?xml version="1.0"?>
+<rss><channel>
+  <item><title>one</title><enclosure url="http://x/1.mp4" length="10"/></item>
+  <group><item><title>two</title></item></group>
+</channel><item><title>three</title></item></rss>"""
+    shows = ClubTwit()._parse_xml(feed)
+    assert [s["Title"] for s in shows] == ["one", "two", "three"]
+    assert shows[0]["Link"] == "http://x/1.mp4" and shows[0]["Length"] == 10
@@ -0,0 +1,105 @@
+import os
+import random
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+pytest.importorskip("requests")
+
+import downloads  # noqa: E402
+
+BODY = random.Random(0).randbytes(2 << 20)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Serves BODY with a different Range behaviour per path.
+
+    /ok honours Range, /norange ignores it with a 200, /cap sends a 206 that
+    stops short of the requested end and /short sends a correct 206 header but
+    closes the connection halfway through the body.
+    """
+    protocol_version = "HTTP/1.0"
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.send_header("Accept-Ranges", "bytes")
+        self.end_headers()
+
+    def do_GET(self):
+        m = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if self.path == "/norange" or m is None:
+            self._send(200, BODY)
+            return
+        start, end = int(m.group(1)), int(m.group(2))
+        if self.path == "/cap":
+            end = min(end, start + (64 << 10) - 1)
+        data = BODY[start:end + 1]
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(BODY)}")
+        if self.path == "/short":
+            self.end_headers()
+            self.wfile.write(data[:len(data) // 2])
+            return
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send(self, status, data):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+@pytest.fixture(scope="module")
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _read(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def test_ranges_complete(server, tmp_path):
+    path = str(tmp_path / "ok.mp4")
+    assert downloads.download_ranges(server + "/ok", path, len(BODY), {'stop': False})
+    assert _read(path) == BODY
+
+
+@pytest.mark.parametrize("endpoint", ["/norange", "/cap"])
+def test_ranges_ignored(server, tmp_path, endpoint):
+    with pytest.raises(downloads.RangeIgnored):
+        downloads.download_ranges(server + endpoint, str(tmp_path / "x.mp4"), len(BODY), {'stop': False})
+
+
+def test_ranges_short_206(server, tmp_path):
+    with pytest.raises(OSError):
+        downloads.download_ranges(server + "/short", str(tmp_path / "x.mp4"), len(BODY), {'stop': False})
+
+
+@pytest.mark.parametrize("endpoint", ["/ok", "/norange", "/cap"])
+def test_download_one_falls_back_to_stream(server, tmp_path, monkeypatch, endpoint):
+    monkeypatch.setattr(downloads, "RANGE_MIN_SIZE", 0)
+    path = str(tmp_path / "x.mp4")
+    assert downloads.download_one(server + endpoint, path, {'stop': False})
+    assert _read(path) == BODY
+
+
+def test_download_one_removes_short_file(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(downloads, "RANGE_MIN_SIZE", 0)
+    path = str(tmp_path / "x.mp4")
+    with pytest.raises(OSError):
+        downloads.download_one(server + "/short", path, {'stop': False})
+    assert not os.path.exists(path)
@@ -0,0 +1,49 @@
+from email.utils import parsedate_to_datetime
+
+import pytest
+
+from sortkeys import add_sort_keys, pubdate_timestamp
+
+
+def _reference(pub_date: str) -> int:
+    """What pubdate_timestamp did before the fast path: parsedate_to_datetime, 0 on failure."""
+    try:
+        dt = parsedate_to_datetime(pub_date)
+        return int(dt.timestamp()) if dt is not None else 0
+    except Exception:
+        return 0
+
+
+@pytest.mark.parametrize("pub_date", [
+    "Wed, 01 Jan 2025 12:34:56 +0000",
+    "Tue, 14 Oct 2025 09:00:00 -0700",
+    "Tue, 14 Oct 2025 09:00:00 +0530",
+    "Tue, 14 Oct 2025 09:00:00 GMT",
+    "Thu, 29 Feb 2024 23:59:59 +0100",
+    "Sat, 1 Mar 2025 00:00:00 +0000",
+    # Shapes the fast path must hand to the fallback
+    "Wed, 01 Jan 25 12:34:56 +0000",
+    "Wed, 32 Jan 2025 12:34:56 +0000",
+    "Sat, 29 Feb 2025 12:34:56 +0000",
+    "Wed, 01 Jan 2025 24:00:00 +0000",
+    "Wed, 01 Jan 2025 12:60:00 +0000",
+    "Wed, 01 Jan 2025 9:34:56 +0000",
+    "Wed, 01 Foo 2025 12:34:56 +0000",
+    "Tue, 14 Oct 2025 09:00:00 PDT",
+    "14 Oct 2025 09:00:00 +0000",
+    "No Date",
+    "",
+])
+def test_matches_parsedate_to_datetime(pub_date: str) -> None:
+    assert pubdate_timestamp(pub_date) == _reference(pub_date)
+
+
+def test_add_sort_keys() -> None:
+    shows = [
+        {"Title": "Security Now", "PubDate": "Wed, 01 Jan 2025 12:34:56 +0000", "Length": 3 << 20},
+        {"Title": None, "PubDate": None, "Length": "bad"},
+    ]
+    add_sort_keys(shows)
+    assert (shows[0]["_ts"], shows[0]["_len"], shows[0]["_mb"], shows[0]["_title_key"]) == \
+        (1735734896, 3 << 20, "3.00", "security now")
+    assert (shows[1]["_ts"], shows[1]["_len"], shows[1]["_mb"], shows[1]["_title_key"]) == (0, 0, "0.00", "")